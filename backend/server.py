@@ -50,19 +50,39 @@ class ConnectionManager:
     
     async def broadcast_to_room(self, message: dict, room_id: str):
         if room_id in self.active_connections:
+            # Encode once per broadcast rather than once per connection
+            payload = json.dumps(message, default=_json_default)
             for connection in self.active_connections[room_id]:
                 try:
-                    await connection.send_text(json.dumps(message))
+                    await connection.send_text(payload)
                 except:
                     pass
 
+def _json_default(value):
+    # Match the ISO format FastAPI uses for datetimes in HTTP responses
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 manager = ConnectionManager()
 
+ROOM_CODE_ALPHABET = string.digits
+ROOM_PASSWORD_ALPHABET = string.ascii_letters + string.digits
+
+def generate_id() -> str:
+    return str(uuid.uuid4())
+
+def generate_room_code() -> str:
+    return ''.join(secrets.choice(ROOM_CODE_ALPHABET) for _ in range(6))
+
+def generate_room_password() -> str:
+    return ''.join(secrets.choice(ROOM_PASSWORD_ALPHABET) for _ in range(8))
+
 # Models
 class Room(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    room_id: str = Field(default_factory=lambda: ''.join(secrets.choice(string.digits) for _ in range(6)))
-    password: str = Field(default_factory=lambda: ''.join(secrets.choice(string.ascii_letters + string.digits) for _ in range(8)))
+    id: str = Field(default_factory=generate_id)
+    room_id: str = Field(default_factory=generate_room_code)
+    password: str = Field(default_factory=generate_room_password)
     name: str
     creator_id: str
     creator_role: str = "faculty"  # faculty or student
@@ -81,7 +101,7 @@ class JoinRoomRequest(BaseModel):
     user_name: str
 
 class Message(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=generate_id)
     room_id: str
     user_id: str
     user_name: str
@@ -100,12 +120,59 @@ class SendMessageRequest(BaseModel):
     message_type: str = "text"
 
 class User(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=generate_id)
     name: str
     role: str  # faculty or student
     current_room: Optional[str] = None
     joined_at: datetime = Field(default_factory=datetime.utcnow)
 
+# Document builders for the hot endpoints.
+# Request bodies are already validated by FastAPI, so these build the stored
+# documents directly instead of re-validating through Room/User/Message and
+# dumping each model several times. Keys mirror the models above.
+def new_user_doc(name: str, role: str, current_room: Optional[str] = None) -> dict:
+    return {
+        "id": generate_id(),
+        "name": name,
+        "role": role,
+        "current_room": current_room,
+        "joined_at": datetime.utcnow(),
+    }
+
+def new_room_doc(name: str, creator_id: str, creator_role: str) -> dict:
+    return {
+        "id": generate_id(),
+        "room_id": generate_room_code(),
+        "password": generate_room_password(),
+        "name": name,
+        "creator_id": creator_id,
+        "creator_role": creator_role,
+        "created_at": datetime.utcnow(),
+        "is_active": True,
+        "participants": [creator_id],
+    }
+
+def new_message_doc(request: SendMessageRequest, can_edit: bool) -> dict:
+    return {
+        "id": generate_id(),
+        "room_id": request.room_id,
+        "user_id": request.user_id,
+        "user_name": request.user_name,
+        "content": request.content,
+        "message_type": request.message_type,
+        "timestamp": datetime.utcnow(),
+        "is_anonymous": True,
+        "can_edit": can_edit,
+        "is_deleted": False,
+    }
+
+async def insert_doc(collection, doc: dict) -> dict:
+    # insert_one adds an ObjectId "_id" to the dict in place; drop it so the
+    # same dict can be returned and broadcast without another copy
+    await collection.insert_one(doc)
+    doc.pop("_id", None)
+    return doc
+
 # Routes
 @api_router.get("/")
 async def root():
@@ -115,30 +182,25 @@ async def root():
 async def create_room(request: CreateRoomRequest):
     try:
         # Create user
-        creator = User(
-            name=request.creator_name,
-            role=request.creator_role
+        creator = await insert_doc(
+            db.users,
+            new_user_doc(request.creator_name, request.creator_role)
         )
-        await db.users.insert_one(creator.dict())
         
         # Create room
-        room = Room(
-            name=request.name,
-            creator_id=creator.id,
-            creator_role=request.creator_role,
-            participants=[creator.id]
+        room = await insert_doc(
+            db.rooms,
+            new_room_doc(request.name, creator["id"], request.creator_role)
         )
         
-        await db.rooms.insert_one(room.dict())
-        
         return {
             "success": True,
             "room": {
-                "room_id": room.room_id,
-                "password": room.password,
-                "name": room.name,
-                "creator_id": creator.id,
-                "creator_name": creator.name
+                "room_id": room["room_id"],
+                "password": room["password"],
+                "name": room["name"],
+                "creator_id": creator["id"],
+                "creator_name": creator["name"]
             }
         }
     except Exception as e:
@@ -158,25 +220,27 @@ async def join_room(request: JoinRoomRequest):
             raise HTTPException(status_code=404, detail="Room not found or invalid credentials")
         
         # Create user
-        user = User(
-            name=request.user_name,
-            role="student",  # Default role for joiners
-            current_room=room["room_id"]
+        user = await insert_doc(
+            db.users,
+            new_user_doc(
+                request.user_name,
+                "student",  # Default role for joiners
+                current_room=room["room_id"]
+            )
         )
-        await db.users.insert_one(user.dict())
         
         # Add user to room participants
         await db.rooms.update_one(
             {"room_id": request.room_id},
-            {"$addToSet": {"participants": user.id}}
+            {"$addToSet": {"participants": user["id"]}}
         )
         
         return {
             "success": True,
             "user": {
-                "user_id": user.id,
-                "user_name": user.name,
-                "role": user.role
+                "user_id": user["id"],
+                "user_name": user["name"],
+                "role": user["role"]
             },
             "room": {
                 "room_id": room["room_id"],
@@ -204,31 +268,25 @@ async def get_room_messages(room_id: str):
 async def send_message(request: SendMessageRequest):
     try:
         # Get user info
-        user = await db.users.find_one({"id": request.user_id}, {"_id": 0})
+        user = await db.users.find_one({"id": request.user_id}, {"_id": 0, "role": 1})
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        message = Message(
-            room_id=request.room_id,
-            user_id=request.user_id,
-            user_name=request.user_name,
-            content=request.content,
-            message_type=request.message_type,
-            can_edit=(user["role"] == "faculty")
+        message = await insert_doc(
+            db.messages,
+            new_message_doc(request, can_edit=(user["role"] == "faculty"))
         )
         
-        await db.messages.insert_one(message.dict())
-        
         # Broadcast to all connections in the room
         await manager.broadcast_to_room(
             {
                 "type": "new_message",
-                "message": message.dict()
+                "message": message
             },
             request.room_id
         )
         
-        return {"success": True, "message": message.dict()}
+        return {"success": True, "message": message}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Per-request allocation and CPU benchmark for the hot backend endpoints.
+Compares the model-based request path against the document builders in
+backend/server.py without touching MongoDB.
+
+Usage: python backend_bench.py [iterations]
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend'))
+
+from server import (  # noqa: E402
+    Message,
+    Room,
+    SendMessageRequest,
+    User,
+    _json_default,
+    new_message_doc,
+    new_room_doc,
+    new_user_doc,
+)
+
+PAYLOAD = {
+    "room_id": "123456",
+    "user_id": "6f1c3d2e-8a4b-4c1d-9e2f-0a1b2c3d4e5f",
+    "user_name": "Anonymous",
+    "content": "Could you explain the difference between bias and variance again?",
+    "message_type": "text",
+}
+
+def send_message_models():
+    """send_message as it was: one Message model dumped three times"""
+    request = SendMessageRequest(**PAYLOAD)
+    message = Message(
+        room_id=request.room_id,
+        user_id=request.user_id,
+        user_name=request.user_name,
+        content=request.content,
+        message_type=request.message_type,
+        can_edit=False
+    )
+    stored = message.model_dump()
+    broadcast = {"type": "new_message", "message": message.model_dump()}
+    response = {"success": True, "message": message.model_dump()}
+    return stored, broadcast, response
+
+def send_message_docs():
+    """send_message now: one document shared by insert, broadcast and response"""
+    request = SendMessageRequest(**PAYLOAD)
+    message = new_message_doc(request, can_edit=False)
+    broadcast = {"type": "new_message", "message": message}
+    response = {"success": True, "message": message}
+    return message, broadcast, response
+
+def create_room_models():
+    creator = User(name="Dr. Sarah Johnson", role="faculty")
+    room = Room(
+        name="Advanced Machine Learning Seminar",
+        creator_id=creator.id,
+        creator_role="faculty",
+        participants=[creator.id]
+    )
+    return creator.model_dump(), room.model_dump()
+
+def create_room_docs():
+    creator = new_user_doc("Dr. Sarah Johnson", "faculty")
+    room = new_room_doc("Advanced Machine Learning Seminar", creator["id"], "faculty")
+    return creator, room
+
+def broadcast_per_connection(connections=30):
+    message = {"type": "new_message", "message": send_message_docs()[0]}
+    return [json.dumps(message, default=_json_default) for _ in range(connections)]
+
+def broadcast_once(connections=30):
+    message = {"type": "new_message", "message": send_message_docs()[0]}
+    payload = json.dumps(message, default=_json_default)
+    return [payload for _ in range(connections)]
+
+def measure(fn, iterations):
+    # Warm up so lazily built validators/serializers are not counted
+    for _ in range(100):
+        fn()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+
+    # Keep results alive so the peak reflects what a request holds at once
+    tracemalloc.start()
+    kept = [fn() for _ in range(iterations)]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+
+    return elapsed / iterations * 1e6, peak / iterations
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    cases = [
+        ("send_message", send_message_models, send_message_docs),
+        ("create_room", create_room_models, create_room_docs),
+        ("broadcast x30", broadcast_per_connection, broadcast_once),
+    ]
+
+    print(f"Iterations per case: {iterations}")
+    print(f"{'case':<16}{'path':<8}{'us/req':>10}{'bytes/req':>12}")
+    print("-" * 46)
+    for name, before, after in cases:
+        before_us, before_bytes = measure(before, iterations)
+        after_us, after_bytes = measure(after, iterations)
+        print(f"{name:<16}{'before':<8}{before_us:>10.2f}{before_bytes:>12.0f}")
+        print(f"{'':<16}{'after':<8}{after_us:>10.2f}{after_bytes:>12.0f}")
+        print(f"{'':<16}{'saved':<8}"
+              f"{(1 - after_us / before_us) * 100:>9.1f}%"
+              f"{(1 - after_bytes / before_bytes) * 100:>11.1f}%")
+
+    per_second = 1000
+    _, before_bytes = measure(send_message_models, iterations)
+    _, after_bytes = measure(send_message_docs, iterations)
+    print(f"\nsend_message at {per_second} msg/s: "
+          f"{before_bytes * per_second / 1024:.0f} KiB/s -> "
+          f"{after_bytes * per_second / 1024:.0f} KiB/s allocated")
+
+if __name__ == "__main__":
+    main()